@@ -0,0 +1,132 @@
+import argparse
+import os
+import tempfile
+import time
+
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.orm import sessionmaker
+
+import bulk_load
+import experimental_db as edb
+
+
+def make_responses(players, legends, stats):
+    """Synthetic bridge responses shaped like legends.all.<legend>.data."""
+    return [
+        (f"player{p}", {
+            'legends': {'all': {
+                f"Legend{l}": {'data': [
+                    {'name': f"Stat {s}", 'key': f"stat_{s}", 'value': p * 1000 + l * 10 + s}
+                    for s in range(stats)
+                ]}
+                for l in range(legends)
+            }}
+        })
+        for p in range(players)
+    ]
+
+
+BENCH_TABLES = ("legend_stat_values", "stat_keys", "legends", "players")
+
+
+def reset(engine):
+    """Empties the value and dictionary tables so every path registers all names itself."""
+    edb.Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for table in BENCH_TABLES:
+            connection.execute(text(f"DELETE FROM {table}"))
+
+
+def check_empty(engine):
+    """Refuses to benchmark on tables that already hold data."""
+    edb.Base.metadata.create_all(engine)
+    with engine.connect() as connection:
+        for table in BENCH_TABLES:
+            if connection.execute(text(f"SELECT 1 FROM {table} LIMIT 1")).first():
+                raise SystemExit(f"Refusing to benchmark: table '{table}' already holds rows.")
+
+
+def same_database(url, other_url):
+    if not url or not other_url:
+        return False
+    render = lambda u: make_url(u).render_as_string(hide_password=False)
+    return render(url) == render(other_url)
+
+
+def postgres_benchmark(pg_url, responses):
+    """Runs the Postgres paths in a throwaway schema that is dropped afterwards."""
+    schema = f"bench_bulk_load_{os.getpid()}"
+    admin = create_engine(pg_url)
+    with admin.begin() as connection:
+        connection.execute(text(f"CREATE SCHEMA {schema}"))
+
+    postgres = create_engine(pg_url, connect_args={"options": f"-csearch_path={schema}"})
+    try:
+        check_empty(postgres)
+        time_path("postgres orm", postgres, lambda: run_orm(postgres, responses))
+        time_path("postgres executemany", postgres,
+                  lambda: bulk_load.bulk_load(postgres, responses, use_copy=False))
+        time_path("postgres copy", postgres, lambda: bulk_load.bulk_load(postgres, responses))
+    finally:
+        postgres.dispose()
+        with admin.begin() as connection:
+            connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        admin.dispose()
+
+
+def run_orm(engine, responses):
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    rows = 0
+    try:
+        legend_cache = edb.DictionaryCache(session, edb.Legend)
+        stat_cache = edb.DictionaryCache(session, edb.StatKey)
+        player_cache = edb.DictionaryCache(session, edb.Player)
+        for player_name, data in responses:
+            rows += edb.store_stat_values(session, player_name, data['legends']['all'],
+                                          legend_cache, stat_cache, player_cache)
+        session.commit()
+    finally:
+        session.close()
+    return rows
+
+
+def time_path(label, engine, load):
+    reset(engine)
+    start = time.perf_counter()
+    rows = load()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {rows:>9} rows  {elapsed:8.2f}s  {rows / elapsed:>12,.0f} rows/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare bulk load paths for legend_stat_values.")
+    parser.add_argument("--players", type=int, default=200)
+    parser.add_argument("--legends", type=int, default=26)
+    parser.add_argument("--stats", type=int, default=20)
+    parser.add_argument("--pg-url", default=os.getenv("BENCH_PG_URL"),
+                        help="Postgres URL for the COPY path (or BENCH_PG_URL). Runs in a "
+                             "temporary schema; must not be the DB_URL database.")
+    args = parser.parse_args()
+
+    if same_database(args.pg_url, edb.APEX_DB):
+        parser.error("--pg-url points at DB_URL; use a separate database for benchmarks")
+
+    responses = make_responses(args.players, args.legends, args.stats)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sqlite = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        check_empty(sqlite)
+        time_path("sqlite orm", sqlite, lambda: run_orm(sqlite, responses))
+        time_path("sqlite executemany", sqlite, lambda: bulk_load.bulk_load(sqlite, responses))
+        sqlite.dispose()
+
+    if not args.pg_url:
+        print("Postgres paths skipped: pass --pg-url or set BENCH_PG_URL.")
+        return
+
+    postgres_benchmark(args.pg_url, responses)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+import argparse
+import json
+import time
+import tracemalloc
+
+import decode
+from cli import build_stat_index
+
+
+def make_payload(legends, stats):
+    """Synthetic bridge response with the parts get_legend_stats never reads."""
+    img_assets = {'icon': "https://example.invalid/icon.png", 'banner': "https://example.invalid/banner.jpg"}
+    payload = {
+        'global': {
+            'name': "player", 'uid': "1000000000", 'platform': "PC", 'level': 500,
+            'rank': {'rankScore': 12000, 'rankName': "Diamond", 'rankDiv': 2},
+            'badges': [{'name': f"Badge {b}", 'value': b} for b in range(50)],
+            'bans': {'isActive': False, 'remainingSeconds': 0},
+        },
+        'realtime': {'lobbyState': "open", 'isOnline': 0, 'selectedLegend': "Wraith"},
+        'legends': {
+            'selected': {'LegendName': "Wraith", 'ImgAssets': img_assets},
+            'all': {
+                f"Legend{l}": {
+                    'data': [
+                        {'name': f"Stat {s}", 'value': l * 1000 + s, 'key': f"stat_{s}",
+                         'rank': {'rankPos': "NOT_CALCULATED_YET", 'topPercent': "NOT_CALCULATED_YET"},
+                         'rankPlatformSpecific': {'rankPos': "NOT_CALCULATED_YET", 'topPercent': "NOT_CALCULATED_YET"}}
+                        for s in range(stats)
+                    ],
+                    'gameInfo': {'badges': [{'name': None, 'value': 0}] * 3},
+                    'ImgAssets': img_assets,
+                }
+                for l in range(legends)
+            },
+        },
+        'mozambiquehere_internal': {'isNewToDB': False, 'claimedBy': "-1", 'APIAccessType': "BASIC"},
+        'total': {f"stat_{s}": {'name': f"Stat {s}", 'value': s} for s in range(stats)},
+    }
+    return json.dumps(payload).encode()
+
+
+def measure(decoder, raw, repeat):
+    start = time.process_time()
+    for _ in range(repeat):
+        decoder(raw)
+    cpu = (time.process_time() - start) / repeat
+
+    tracemalloc.start()
+    decoder(raw)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare response decoding paths.")
+    parser.add_argument("--legends", type=int, default=26)
+    parser.add_argument("--stats", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    raw = make_payload(args.legends, args.stats)
+    expected = build_stat_index(json.loads(raw))
+
+    decoders = [("full json.loads", json.loads)] + [
+        (name, lambda raw, name=name: decode.decode_legend_stats(raw, name))
+        for name in decode.available_decoders()
+    ]
+
+    print(f"payload: {len(raw):,} bytes, {args.legends} legends x {args.stats} stats")
+    for label, decoder in decoders:
+        same = build_stat_index(decoder(raw)) == expected
+        cpu, peak = measure(decoder, raw, args.repeat)
+        print(f"{label:<16} {cpu * 1000:8.3f} ms CPU/response  {peak / 1024:9.1f} KiB peak alloc  "
+              f"{'same stats' if same else 'STATS DIFFER'}")
+
+
+if __name__ == '__main__':
+    main()
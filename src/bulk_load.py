@@ -0,0 +1,142 @@
+import csv
+import io
+import os
+import sys
+from datetime import datetime
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+import decode
+import experimental_db as edb
+
+
+COLUMNS = ["player_id", "legend_id", "stat_id", "value", "recorded_at"]
+CHUNK_SIZE = 10000
+
+UPSERT_SET = (
+    "ON CONFLICT (player_id, legend_id, stat_id) DO UPDATE "
+    "SET value = excluded.value, recorded_at = excluded.recorded_at "
+    "WHERE legend_stat_values.value <> excluded.value"
+)
+
+
+def extract_rows(session, responses):
+    """Turns (player_name, bridge response) pairs into legend_stat_values rows.
+
+    Player, legend and stat key ids are resolved through DictionaryCache, so
+    new names get registered in the session. Duplicate keys keep the last
+    value, which the set-based upsert needs (one source row per target row).
+    """
+    player_cache = edb.DictionaryCache(session, edb.Player)
+    legend_cache = edb.DictionaryCache(session, edb.Legend)
+    stat_cache = edb.DictionaryCache(session, edb.StatKey)
+    now = datetime.now()
+    rows = {}
+
+    for player_name, data in responses:
+        all_legends = ((data or {}).get('legends') or {}).get('all') or {}
+        if not all_legends:
+            print(f"Skipping {player_name}: no legend data in response.")
+            continue
+        player_id = player_cache.get_id(player_name)
+
+        for legend_id, stat_id, value in edb.iter_stat_values(all_legends, legend_cache, stat_cache):
+            rows[(player_id, legend_id, stat_id)] = (player_id, legend_id, stat_id, value, now)
+
+    return list(rows.values())
+
+
+def copy_rows(engine, rows):
+    """Postgres path: COPY rows into a temp staging table, then upsert in one statement."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(row)
+    buffer.seek(0)
+
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        cursor.execute(
+            "CREATE TEMP TABLE legend_stat_values_staging "
+            "(LIKE legend_stat_values INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        cursor.copy_expert(
+            f"COPY legend_stat_values_staging ({', '.join(COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+        cursor.execute(
+            f"INSERT INTO legend_stat_values ({', '.join(COLUMNS)}) "
+            f"SELECT {', '.join(COLUMNS)} FROM legend_stat_values_staging "
+            f"{UPSERT_SET}"
+        )
+        raw.commit()
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+
+
+def executemany_rows(engine, rows, chunk_size=CHUNK_SIZE):
+    """Portable path (SQLite and others): chunked executemany of the same upsert."""
+    statement = text(
+        f"INSERT INTO legend_stat_values ({', '.join(COLUMNS)}) "
+        f"VALUES ({', '.join(':' + column for column in COLUMNS)}) "
+        f"{UPSERT_SET}"
+    )
+    with engine.begin() as connection:
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            connection.execute(statement, [dict(zip(COLUMNS, row)) for row in chunk])
+
+
+def bulk_load(engine, responses, use_copy=None):
+    """Loads many responses into legend_stat_values. Returns the number of rows sent.
+
+    COPY is used on Postgres unless use_copy is False; other databases
+    always take the executemany path.
+    """
+    if use_copy is None:
+        use_copy = engine.dialect.name == 'postgresql'
+
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    try:
+        rows = extract_rows(session, responses)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+    if use_copy:
+        copy_rows(engine, rows)
+    else:
+        executemany_rows(engine, rows)
+    return len(rows)
+
+
+def read_cached_responses(cache_dir):
+    """Yields (player_name, response) for every <player>.json in cache_dir."""
+    for file_name in sorted(os.listdir(cache_dir)):
+        if not file_name.endswith('.json'):
+            continue
+        with open(os.path.join(cache_dir, file_name), "rb") as f:
+            yield file_name[:-len('.json')], decode.decode_legend_stats(f.read())
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print("Usage: python bulk_load.py <directory of <player>.json responses>")
+        sys.exit(1)
+    if not edb.APEX_DB:
+        print("Error: Environment variable 'DB_URL' is not set.")
+        sys.exit(1)
+
+    engine = create_engine(edb.APEX_DB)
+    edb.Base.metadata.create_all(engine)
+    loaded = bulk_load(engine, read_cached_responses(sys.argv[1]))
+    print(f"Loaded {loaded} stat values.")
@@ -0,0 +1,229 @@
+import argparse
+import csv
+import json
+import os
+import sys
+
+import decode
+
+
+OUTPUT_FIELDS = ["player", "legend", "stat", "name", "value"]
+
+
+def build_stat_index(data):
+    """Turns a bridge response into {legend: {stat_key: (name, value)}}."""
+
+    index = {}
+    all_legends = ((data or {}).get('legends') or {}).get('all') or {}
+
+    for legend_name, legend_data in all_legends.items():
+        legend_stats = {}
+        for stat_entry in (legend_data or {}).get('data', []) or []:
+            key = stat_entry.get('key')
+            if key is None:
+                continue
+            legend_stats[key] = (stat_entry.get('name', key), stat_entry.get('value'))
+        index[legend_name] = legend_stats
+
+    return index
+
+
+def load_from_api(player, platform):
+    from dotenv import load_dotenv
+
+    # api exits at import time without a key; fail this player instead.
+    load_dotenv()
+    if not os.getenv("API_KEY"):
+        raise EnvironmentError("Environment variable 'API_KEY' is not set")
+    import api
+
+    data = api.fetch_player_stats(
+        api.URL, api.headers, {"platform": platform, "player": player}, legends_only=True
+    )
+    return build_stat_index(data)
+
+
+def load_from_cache(player, cache_dir):
+    path = os.path.join(cache_dir, f"{player}.json")
+    with open(path, "rb") as f:
+        return build_stat_index(decode.decode_legend_stats(f.read()))
+
+
+def load_from_db(player, Session):
+    """Reads every stored stat key for the player from legend_stat_values."""
+    import experimental_db as edb
+
+    session = Session()
+    try:
+        rows = (
+            session.query(edb.Legend.name, edb.StatKey.name, edb.LegendStatValue.value)
+            .join(edb.Player, edb.Player.id == edb.LegendStatValue.player_id)
+            .join(edb.Legend, edb.Legend.id == edb.LegendStatValue.legend_id)
+            .join(edb.StatKey, edb.StatKey.id == edb.LegendStatValue.stat_id)
+            .filter(edb.Player.name == player)
+        )
+        index = {}
+        for legend_name, stat_key, value in rows:
+            index.setdefault(legend_name, {})[stat_key] = (stat_key, value)
+        return index
+    finally:
+        session.close()
+
+
+def read_query_file(path):
+    """Reads 'player,legend,stat' lines; '#' starts a comment.
+
+    An empty legend or stat field means 'all', like leaving out -l/-s.
+    """
+
+    queries = []
+    with open(path, encoding="utf-8", newline="") as f:
+        for row in csv.reader(f):
+            if not row or row[0].strip().startswith('#'):
+                continue
+            if len(row) != 3:
+                raise ValueError(f"Bad query line in {path}: {','.join(row)}")
+            player, legend, stat = (field.strip() or None for field in row)
+            if player is None:
+                raise ValueError(f"Missing player in {path}: {','.join(row)}")
+            queries.append((player, legend, stat))
+    return queries
+
+
+def expand_queries(players, legends, stats):
+    """Cross product of the arguments. None for legend/stat means 'all'."""
+
+    return [
+        (player, legend, stat)
+        for player in players
+        for legend in (legends or [None])
+        for stat in (stats or [None])
+    ]
+
+
+def answer_queries(queries, load_index, errors=None):
+    """Yields one result row per (player, legend, stat) match.
+
+    Each player's stats are loaded once and every query for that
+    player is answered from the same index. Players that could not be
+    loaded or have no legend data, and legends missing from a player's
+    stats, are reported on stderr once, appended to `errors` and skipped.
+    A stat key missing from a known legend yields a row with value None.
+    """
+
+    indexes = {}
+    reported = set()
+
+    def report(message):
+        if message in reported:
+            return
+        reported.add(message)
+        print(message, file=sys.stderr)
+        if errors is not None:
+            errors.append(message)
+
+    for player, legend, stat in queries:
+        if player not in indexes:
+            try:
+                indexes[player] = load_index(player)
+            except Exception as e:
+                report(f"Error loading stats for {player}: {e}")
+                indexes[player] = None
+
+        index = indexes[player]
+        if index is None:
+            continue
+        if not index:
+            report(f"No legend data found for {player}.")
+            continue
+
+        legend_names = list(index) if legend is None else [legend]
+        for legend_name in legend_names:
+            legend_stats = index.get(legend_name)
+            if legend_stats is None:
+                report(f"Legend {legend_name} not found for {player}.")
+                continue
+            stat_keys = list(legend_stats) if stat is None else [stat]
+            for stat_key in stat_keys:
+                name, value = legend_stats.get(stat_key, (stat_key, None))
+                yield {
+                    "player": player,
+                    "legend": legend_name,
+                    "stat": stat_key,
+                    "name": name,
+                    "value": value,
+                }
+
+
+def write_rows(rows, out, output_format):
+    if output_format == "csv":
+        writer = csv.DictWriter(out, fieldnames=OUTPUT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        for row in rows:
+            out.write(json.dumps(row) + "\n")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Answer many legend stat queries in one run."
+    )
+    parser.add_argument("-p", "--player", action="append", default=[],
+                        help="Player name (repeatable).")
+    parser.add_argument("-l", "--legend", action="append", default=[],
+                        help="Legend name (repeatable). Defaults to every legend.")
+    parser.add_argument("-s", "--stat", action="append", default=[],
+                        help="Stat key (repeatable). Defaults to every stat.")
+    parser.add_argument("-f", "--query-file",
+                        help="File with one 'player,legend,stat' query per line.")
+    parser.add_argument("--platform", default="PC")
+    parser.add_argument("--source", choices=["api", "db", "cache"], default="api",
+                        help="Where to read stats from.")
+    parser.add_argument("--cache-dir", default="cache",
+                        help="Directory of saved responses named <player>.json (--source cache).")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument("-o", "--output", help="Output file. Defaults to stdout.")
+
+    args = parser.parse_args(argv)
+    if not args.player and not args.query_file:
+        parser.error("give at least one --player or a --query-file")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    queries = expand_queries(args.player, args.legend, args.stat)
+    if args.query_file:
+        queries.extend(read_query_file(args.query_file))
+
+    if args.source == "db":
+        import experimental_db as edb
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+
+        if not edb.APEX_DB:
+            print("Error: Environment variable 'DB_URL' is not set.", file=sys.stderr)
+            return 1
+        Session = sessionmaker(bind=create_engine(edb.APEX_DB))
+        load_index = lambda player: load_from_db(player, Session)
+    elif args.source == "cache":
+        load_index = lambda player: load_from_cache(player, args.cache_dir)
+    else:
+        load_index = lambda player: load_from_api(player, args.platform)
+
+    errors = []
+    rows = answer_queries(queries, load_index, errors)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as out:
+            write_rows(rows, out, args.format)
+    else:
+        write_rows(rows, sys.stdout, args.format)
+
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
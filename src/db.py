@@ -1,5 +1,6 @@
 import os
 import api
+import experimental_db
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, Column, Integer, String, DateTime
 from sqlalchemy.orm import sessionmaker, declarative_base
@@ -32,6 +33,12 @@ class LegendStat(Base):
         )
     
 Base.metadata.create_all(engine)
+experimental_db.Base.metadata.create_all(engine, tables=[
+    experimental_db.Player.__table__,
+    experimental_db.Legend.__table__,
+    experimental_db.StatKey.__table__,
+    experimental_db.LegendStatValue.__table__,
+])
 Session = sessionmaker(bind=engine)
 
 def update_or_insert(legend_name, kills, wins, damage):
@@ -110,7 +117,7 @@ def update_legend_stats_api():
     
     print("--- Starting API Fetch and Database Update ---")
     
-    data = api.get_data()
+    data = api.get_data(legends_only=True)
     if data is None:
         print("Update Failed: Could not fetch player data from API.")
         return False
@@ -125,6 +132,17 @@ def update_legend_stats_api():
         
         kills, wins, damage = get_legend_stats(data, legend_name)
         update_or_insert(legend_name, kills, wins, damage)
+
+    session = Session()
+    try:
+        values_written = experimental_db.store_stat_values(session, api.params['player'], all_legends_data)
+        session.commit()
+        print(f"Stored {values_written} new or changed stat values.")
+    except Exception as e:
+        print(f"Something went wrong storing stat values: {e}")
+        session.rollback()
+    finally:
+        session.close()
         
     print("--- Database Update Complete ---")
     return True
@@ -0,0 +1,54 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _legends_only(payload):
+    """Keeps legends.all of a parsed response, or None if it is missing.
+
+    Error bodies such as {"Error": "Player not found."} have no legends
+    and give None, like a failed fetch.
+    """
+    legends = payload.get('legends') if isinstance(payload, dict) else None
+    all_legends = legends.get('all') if isinstance(legends, dict) else None
+    if not isinstance(all_legends, dict):
+        return None
+    return {'legends': {'all': all_legends}}
+
+
+def decode_stdlib(raw):
+    return _legends_only(json.loads(raw))
+
+
+def decode_orjson(raw):
+    return _legends_only(orjson.loads(raw))
+
+
+DECODERS = {
+    'orjson': decode_orjson if orjson else None,
+    'stdlib': decode_stdlib,
+}
+
+
+def available_decoders():
+    return [name for name, decoder in DECODERS.items() if decoder]
+
+
+def decode_legend_stats(raw, backend=None):
+    """Decodes raw response bytes keeping only legends.all.
+
+    The result has the same shape as the full response for those keys, so
+    it can be passed to get_legend_stats; the rest of the payload is released
+    right away. Returns None when the response has no legend data. With no
+    backend given orjson is used when installed, falling back to the stdlib
+    json module.
+    """
+    if backend is None:
+        backend = available_decoders()[0]
+    decoder = DECODERS.get(backend)
+    if decoder is None:
+        raise ValueError(f"JSON backend '{backend}' is not available")
+    return decoder(raw)
@@ -1,7 +1,8 @@
 import os
 import requests
 import time
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, UniqueConstraint
+import decode
+from sqlalchemy import create_engine, Column, Integer, BigInteger, String, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import declarative_base, sessionmaker
 from datetime import datetime
 from dotenv import load_dotenv
@@ -66,6 +67,143 @@ class LegendStats(Base):
         return (f"LegendStat(player='{self.player_name}', legend='{self.legend_name}', "
                 f"Kills={self.kills}, Wins={self.wins})")
 
+
+class Player(Base):
+    __tablename__ = 'players'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True, nullable=False)
+
+    def __repr__(self):
+        return f"Player(id={self.id}, name='{self.name}')"
+
+class Legend(Base):
+    __tablename__ = 'legends'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True, nullable=False)
+
+    def __repr__(self):
+        return f"Legend(id={self.id}, name='{self.name}')"
+
+class StatKey(Base):
+    __tablename__ = 'stat_keys'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True, nullable=False)
+
+    def __repr__(self):
+        return f"StatKey(id={self.id}, name='{self.name}')"
+
+class LegendStatValue(Base):
+    __tablename__ = 'legend_stat_values'
+
+    player_id = Column(Integer, ForeignKey('players.id'), primary_key=True)
+    legend_id = Column(Integer, ForeignKey('legends.id'), primary_key=True)
+    stat_id = Column(Integer, ForeignKey('stat_keys.id'), primary_key=True)
+    value = Column(BigInteger, default=0, nullable=False)
+    recorded_at = Column(DateTime, default = datetime.now)
+
+    def __repr__(self):
+        return (f"LegendStatValue(player_id={self.player_id}, legend_id={self.legend_id}, "
+                f"stat_id={self.stat_id}, value={self.value})")
+
+
+class DictionaryCache:
+    """Maps names to ids for one of the dictionary tables (players, legends, stat_keys).
+
+    Known ids are loaded once; names seen for the first time are inserted
+    and cached, so repeated lookups during ingestion never hit the database.
+    """
+
+    def __init__(self, session, model):
+        self.session = session
+        self.model = model
+        self.ids = dict(session.query(model.name, model.id).all())
+
+    def get_id(self, name):
+        entry_id = self.ids.get(name)
+        if entry_id is None:
+            entry = self.model(name=name)
+            self.session.add(entry)
+            self.session.flush()
+            entry_id = self.ids[name] = entry.id
+        return entry_id
+
+
+def to_int(value):
+    """Returns value as an int, or None if it is not a whole number."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return int(number) if number.is_integer() else None
+
+def iter_stat_values(all_legends, legend_cache, stat_cache):
+    """Yields (legend_id, stat_id, value) for every storable stat of every legend.
+
+    Entries without a key or with a value that is not a whole number are
+    skipped. Legend and stat key names are resolved through the caches.
+    """
+    for legend_name, legend_data in all_legends.items():
+        legend_id = legend_cache.get_id(legend_name)
+
+        for stat_entry in (legend_data or {}).get('data', []) or []:
+            value = to_int(stat_entry.get('value'))
+            if value is None or stat_entry.get('key') is None:
+                continue
+            yield legend_id, stat_cache.get_id(stat_entry['key']), value
+
+def store_stat_values(session, player_name, all_legends,
+                      legend_cache=None, stat_cache=None, player_cache=None):
+    """Writes every stat key of every legend as (player_id, legend_id, stat_id) -> value.
+
+    Existing rows for the player are loaded once and only changed values
+    are rewritten. Pass the caches in when storing many players in one
+    session. Returns the number of rows inserted or updated.
+    """
+    legend_cache = legend_cache or DictionaryCache(session, Legend)
+    stat_cache = stat_cache or DictionaryCache(session, StatKey)
+    player_cache = player_cache or DictionaryCache(session, Player)
+    player_id = player_cache.get_id(player_name)
+
+    existing = {
+        (row.legend_id, row.stat_id): row
+        for row in session.query(LegendStatValue).filter_by(player_id=player_id)
+    }
+    now = datetime.now()
+    changed = 0
+
+    for legend_id, stat_id, value in iter_stat_values(all_legends, legend_cache, stat_cache):
+        record = existing.get((legend_id, stat_id))
+        if record is None:
+            record = LegendStatValue(
+                player_id=player_id,
+                legend_id=legend_id,
+                stat_id=stat_id,
+                value=value,
+                recorded_at=now,
+            )
+            session.add(record)
+            existing[(legend_id, stat_id)] = record
+        elif record.value != value:
+            record.value = value
+            record.recorded_at = now
+        else:
+            continue
+        changed += 1
+
+    return changed
+
     
 def init_db(conn = APEX_DB):
     if not conn:
@@ -82,20 +220,26 @@ def init_db(conn = APEX_DB):
         print("Error connecting to database or creating tables: {e}")
         return None
 
-def fetch_player_stats(URL, headers, params):
+def fetch_player_stats(URL, headers, params, legends_only=False):
     try: 
         response = requests.get(URL, headers=headers, params=params)
         response.raise_for_status()
         print(f"Status Code: {response.status_code}")
+        if legends_only:
+            return decode.decode_legend_stats(response.content)
         return response.json() 
     except requests.exceptions.RequestException as e:
         print(f"API call failed: {e}")
         return None
+    except ValueError as e:
+        # json and orjson decode errors both subclass ValueError.
+        print(f"Could not decode API response: {e}")
+        return None
     
 def ingest_data(db_engine):
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting data ingestion...")
 
-    data = fetch_player_stats(URL, headers, params)
+    data = fetch_player_stats(URL, headers, params, legends_only=True)
 
     if not data or 'legends' not in data:
         print("Failed to retrieve valid data from API.")
@@ -147,8 +291,11 @@ def ingest_data(db_engine):
                 )
                 session.add(new_stat)
             stats_processed += 1
+
+        values_written = store_stat_values(session, player_name, all_legends)
         session.commit()
-        print(f"Successfully committed {stats_processed} legend records to database. ")    
+        print(f"Successfully committed {stats_processed} legend records to database. ")
+        print(f"Stored {values_written} new or changed stat values.")    
     except Exception as e:
         session.rollback()
         print(f"An error occurred during database commit: {e}")